@@ -17,7 +17,17 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from abc import abstractmethod
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QIODevice,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSaveFile,
+    QThreadPool,
+    Qt,
+    Signal
+)
 from PySide6.QtGui import (
     QAction,
     QFont,
@@ -31,8 +41,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QHeaderView,
     QPlainTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -62,6 +71,9 @@ class DarkTheme:
     _TABLET_FONT_SIZE = 16
     _TABLET_DIAGONAL_INCH = 9
 
+    _stylesheet: Optional[str] = None
+    _tablet_stylesheet: Optional[str] = None
+
     @classmethod
     def get_color(cls, color_name: str) -> str:
         return cls._CATPPUCCIN_PALETTE.get(color_name, "#000000")
@@ -90,13 +102,27 @@ class DarkTheme:
             palette.setColor(role, QColor(color))
 
         app.setPalette(palette)
-        cls._apply_stylesheet(app)
-        cls.apply_adaptive_styles(app)
+        app.setStyleSheet(
+            cls._get_stylesheet(cls.is_tablet_device(app))
+        )
 
     @classmethod
-    def _apply_stylesheet(cls, app: QApplication) -> None:
+    def _get_stylesheet(cls, tablet: bool) -> str:
+        if cls._stylesheet is None:
+            cls._stylesheet = cls._build_stylesheet()
+        if not tablet:
+            return cls._stylesheet
+        if cls._tablet_stylesheet is None:
+            cls._tablet_stylesheet = cls._stylesheet + f"""
+                QWidget {{ font-size: {cls._TABLET_FONT_SIZE}px; }}
+                QTabBar::tab {{ padding: 8px 16px; }}
+            """
+        return cls._tablet_stylesheet
+
+    @classmethod
+    def _build_stylesheet(cls) -> str:
         colors = cls._CATPPUCCIN_PALETTE
-        stylesheet = f"""
+        return f"""
             /* Global Styles */
             QWidget {{
                 font-family: "Inter", "Segoe UI", system-ui;
@@ -158,7 +184,7 @@ class DarkTheme:
             }}
 
             /* Tables - Fixed rounded corners */
-            QTableWidget {{
+            QTableView {{
                 background: {colors['button']};
                 border: 1px solid {colors['surface1']};
                 gridline-color: {colors['surface1']};
@@ -175,7 +201,7 @@ class DarkTheme:
                 padding: 4px;
                 border: 1px solid {colors['surface1']};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px;
             }}
 
@@ -241,20 +267,17 @@ class DarkTheme:
                 background: {colors['overlay0']};
             }}
         """
-        app.setStyleSheet(stylesheet)
 
     @classmethod
     def apply_adaptive_styles(cls, app: QApplication) -> None:
         if cls.is_tablet_device(app):
-            app.setStyleSheet(app.styleSheet() + f"""
-                QWidget {{ font-size: {cls._TABLET_FONT_SIZE}px; }}
-                QTabBar::tab {{ padding: 8px 16px; }}
-            """)
+            app.setStyleSheet(cls._get_stylesheet(True))
 
     @staticmethod
     def is_tablet_device(app: QApplication) -> bool:
         screen = app.primaryScreen()
-        diag = (screen.size().width()**2 + screen.size().height()**2)**0.5
+        size = screen.size()
+        diag = (size.width()**2 + size.height()**2)**0.5
         return (
             diag / screen.logicalDotsPerInch()
             <=
@@ -299,14 +322,14 @@ class TokenType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorInfo:
     line: int
     column: int
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     type: TokenType
     value: str
@@ -314,7 +337,7 @@ class Token:
     column: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quadruple:
     operator: str
     arg1: str
@@ -428,6 +451,11 @@ class AnalizerService:
         self._lexer = lexer
         self._parser = parser
         self._logger = logger
+        self._error_handlers: List[ErrorHandlerProtocol] = []
+        for component in (lexer, parser):
+            handler = getattr(component, '_error_handler', None)
+            if handler is not None and handler not in self._error_handlers:
+                self._error_handlers.append(handler)
 
     def analize(
         self,
@@ -439,16 +467,8 @@ class AnalizerService:
                 {"code_length": len(code)}
             )
 
-            if hasattr(
-                self._lexer,
-                '_error_handler'
-            ):
-                self._lexer._error_handler.clear()  # pyright: ignore
-            if hasattr(
-                self._parser,
-                '_error_handler'
-            ):
-                self._parser._error_handler.clear()  # pyright: ignore
+            for handler in self._error_handlers:
+                handler.clear()
 
             tokens, lex_errors = self._lexer.tokenize(code)
             self._log_errors(
@@ -526,6 +546,19 @@ class FileWriteCommand(Command[None]):
         self._service.write(self._path, self._content)
 
 
+class AnalizeCommand(Command[AnalizationResult]):
+    def __init__(
+        self,
+        code: str,
+        analizer: AnalizerService
+    ) -> None:
+        self._code = code
+        self._analizer = analizer
+
+    def execute(self) -> AnalizationResult:
+        return self._analizer.analize(self._code)
+
+
 # endregion
 
 
@@ -564,10 +597,10 @@ class PositionTracker:
         self,
         text: str
     ) -> None:
-        lines = text.split('\n')
-        if len(lines) > 1:
-            self._line += len(lines) - 1
-            self._column = len(lines[-1]) + 1
+        newlines = text.count('\n')
+        if newlines:
+            self._line += newlines
+            self._column = len(text) - text.rfind('\n')
         else:
             self._column += len(text)
 
@@ -598,6 +631,20 @@ class RegexLexer(LexerProtocol):
         (TokenType.WHITESPACE, r'\s+'),
     ]
 
+    _TOKEN_REGEX = re.compile(
+        '|'.join(
+            f'(?P<{token_type.name}>{pattern})'
+            for token_type, pattern in _TOKEN_SPECS
+        ),
+        re.MULTILINE
+    )
+
+    _GROUP_TOKEN_TYPES = tuple(
+        token_type for token_type, _ in _TOKEN_SPECS
+    )
+
+    _INVALID_RUN_REGEX = re.compile(r'[^+\-*/()\s]*')
+
     def __init__(
         self,
         error_handler: ErrorHandlerProtocol,
@@ -605,22 +652,6 @@ class RegexLexer(LexerProtocol):
     ) -> None:
         self._error_handler = error_handler
         self._logger = logger
-        self._regex = self._build_regex()
-        self._token_start_chars = {
-            '+', '-', '*', '/',
-            '(', ')', ' ', '\t',
-            '\n', '\r'
-        }
-
-    def _build_regex(self) -> re.Pattern:
-        regex_parts = [
-            f'(?P<{token_type.name}>{pattern})'
-            for token_type, pattern in self._TOKEN_SPECS
-        ]
-        return re.compile(
-            '|'.join(regex_parts),
-            re.MULTILINE
-        )
 
     def tokenize(
         self,
@@ -638,10 +669,12 @@ class RegexLexer(LexerProtocol):
 
             tokens: List[Token] = []
             tracker = PositionTracker()
+            match_token = self._TOKEN_REGEX.match
+            length = len(text)
             pos = 0
 
-            while pos < len(text):
-                match = self._regex.match(
+            while pos < length:
+                match = match_token(
                     text,
                     pos
                 )
@@ -676,9 +709,11 @@ class RegexLexer(LexerProtocol):
         tokens: List[Token],
         tracker: PositionTracker
     ) -> None:
-        token_type = TokenType[match.lastgroup]  # type: ignore
+        token_type = self._GROUP_TOKEN_TYPES[
+            match.lastindex - 1  # type: ignore
+        ]
         value = match.group()
-        if token_type != TokenType.WHITESPACE:
+        if token_type is not TokenType.WHITESPACE:
             tokens.append(Token(
                 type=token_type,
                 value=value,
@@ -697,11 +732,7 @@ class RegexLexer(LexerProtocol):
         start_line = tracker.line
         start_column = tracker.column
 
-        while pos < len(text):
-            c = text[pos]
-            if c in self._token_start_chars or c.isspace():
-                break
-            pos += 1
+        pos = self._INVALID_RUN_REGEX.match(text, pos).end()  # type: ignore
 
         if start_pos > 0 and text[start_pos - 1].isalpha():
             garbage = text[start_pos - 1:pos]
@@ -728,7 +759,7 @@ class RegexLexer(LexerProtocol):
         line: int,
         column: int
     ) -> None:
-        corrected = ''.join([c for c in garbage if c.isalpha()])
+        corrected = ''.join(filter(str.isalpha, garbage))
         if corrected:
             error_msg = f"Заменить '{garbage}' на '{corrected}'"
             self._error_handler.add_error(
@@ -750,6 +781,16 @@ class RegexLexer(LexerProtocol):
 
 
 class RecursiveDescentParser(ParserProtocol):
+    _ADDITIVE_OPERATORS = frozenset({
+        TokenType.PLUS,
+        TokenType.MINUS
+    })
+    _MULTIPLICATIVE_OPERATORS = frozenset({
+        TokenType.MULTIPLY,
+        TokenType.DIVIDE
+    })
+    _OPERATORS = _ADDITIVE_OPERATORS | _MULTIPLICATIVE_OPERATORS
+
     def __init__(
         self,
         error_handler: ErrorHandlerProtocol,
@@ -805,12 +846,7 @@ class RecursiveDescentParser(ParserProtocol):
         self,
         left: str
     ) -> str:
-        while self._match_operator(
-            {
-                TokenType.PLUS,
-                TokenType.MINUS
-            }
-        ):
+        while self._match_operator(self._ADDITIVE_OPERATORS):
             op_token = self._consume()
             right = self._parse_term()
             left = self._emit_operation(
@@ -828,12 +864,7 @@ class RecursiveDescentParser(ParserProtocol):
         self,
         left: str
     ) -> str:
-        while self._match_operator(
-            {
-                TokenType.MULTIPLY,
-                TokenType.DIVIDE
-            }
-        ):
+        while self._match_operator(self._MULTIPLICATIVE_OPERATORS):
             op_token = self._consume()
             right = self._parse_factor()
             left = self._emit_operation(
@@ -913,17 +944,19 @@ class RecursiveDescentParser(ParserProtocol):
         self,
         token_type: TokenType
     ) -> bool:
-        if not self._current_token:
+        token = self._current_token
+        if not token:
             return False
-        return self._current_token.type == token_type
+        return token.type == token_type
 
     def _match_operator(
         self,
-        types: set[TokenType]
+        types: frozenset[TokenType]
     ) -> bool:
-        if not self._current_token:
+        token = self._current_token
+        if not token:
             return False
-        return self._current_token.type in types
+        return token.type in types
 
     def _parse_identifier(self) -> str:
         current_token = self._current_token
@@ -932,10 +965,7 @@ class RecursiveDescentParser(ParserProtocol):
                 msg = (
                     f"Неожиданный оператор '{current_token.value}' "
                     "вместо идентификатора"
-                    if current_token.type in {
-                        TokenType.PLUS, TokenType.MINUS,
-                        TokenType.MULTIPLY, TokenType.DIVIDE
-                    }
+                    if current_token.type in self._OPERATORS
                     else (
                         "Ожидается идентификатор, но "
                         f"получено '{current_token.value}'"
@@ -975,7 +1005,7 @@ class ConsoleLogger(LoggerProtocol):
         getattr(
             self._logger,
             level
-        )(f"{message} | {metadata}")
+        )("%s | %s", message, metadata)
 
     def error(
         self,
@@ -1020,15 +1050,15 @@ class FileServiceAdapter(FileServiceProtocol):
         path: str,
         content: str
     ) -> None:
-        try:
-            with open(
-                path,
-                'w',
-                encoding='utf-8'
-            ) as f:
-                f.write(content)
-        except IOError as e:
-            raise FileServiceError(f"Ошибка записи: {e}")
+        file = QSaveFile(path)
+        if not file.open(
+            QIODevice.OpenModeFlag.WriteOnly
+            | QIODevice.OpenModeFlag.Text
+        ):
+            raise FileServiceError(f"Ошибка записи: {file.errorString()}")
+        file.write(content.encode('utf-8'))
+        if not file.commit():
+            raise FileServiceError(f"Ошибка записи: {file.errorString()}")
 
 
 # endregion
@@ -1072,6 +1102,38 @@ class QuadrupleGenerator:
 # endregion
 
 
+# region Workers
+
+
+class CommandSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class CommandTask(QRunnable):
+    def __init__(
+        self,
+        command: Command[Any],
+        ticket: int,
+        signals: CommandSignals
+    ) -> None:
+        super().__init__()
+        self._command = command
+        self._ticket = ticket
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self._command.execute()
+        except Exception as e:
+            self._signals.failed.emit(self._ticket, str(e))
+        else:
+            self._signals.finished.emit(self._ticket, result)
+
+
+# endregion
+
+
 # region UI Layer
 
 
@@ -1084,27 +1146,100 @@ class TextEditor(QPlainTextEdit):
         self.setFont(QFont("Fira Code", 12))
 
 
+class SequenceTableModel(QAbstractTableModel):
+    def __init__(
+        self,
+        headers: List[str],
+        mapper: Callable[[Any], List[str]]
+    ) -> None:
+        super().__init__()
+        self._headers = headers
+        self._mapper = mapper
+        self._items: Sequence[Any] = []
+        self._rows: Dict[int, List[str]] = {}
+
+    def set_items(
+        self,
+        items: Sequence[Any]
+    ) -> None:
+        self.beginResetModel()
+        self._items = items
+        self._rows = {}
+        self.endResetModel()
+
+    def rowCount(
+        self,
+        parent: QModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(
+        self,
+        parent: QModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = index.row()
+        values = self._rows.get(row)
+        if values is None:
+            values = self._rows[row] = self._mapper(self._items[row])
+        return values[index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if (
+            role != Qt.ItemDataRole.DisplayRole
+            or orientation != Qt.Orientation.Horizontal
+        ):
+            return None
+        return self._headers[section]
+
+
 class ResultsView(QTabWidget):
     def __init__(self) -> None:
         super().__init__()
         self._init_tabs()
 
     def _init_tabs(self) -> None:
-        self._quadruples_table = self._create_table(
+        self._quadruples_model = SequenceTableModel(
             [
                 "Операция",
                 "Аргумент 1",
                 "Аргумент 2",
                 "Результат"
+            ],
+            lambda q: [
+                q.operator,
+                q.arg1,
+                q.arg2,
+                q.result
             ]
         )
-        self._errors_table = self._create_table(
+        self._errors_model = SequenceTableModel(
             [
                 "Строка",
                 "Колонка",
                 "Сообщение"
+            ],
+            lambda e: [
+                str(e.line),
+                str(e.column),
+                e.message
             ]
         )
+        self._quadruples_table = self._create_table(self._quadruples_model)
+        self._errors_table = self._create_table(self._errors_model)
 
         self.addTab(
             self._quadruples_table,
@@ -1117,13 +1252,12 @@ class ResultsView(QTabWidget):
 
     def _create_table(
         self,
-        headers: List[str]
-    ) -> QTableWidget:
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
+        model: SequenceTableModel
+    ) -> QTableView:
+        table = QTableView()
+        table.setModel(model)
         table.verticalHeader().setVisible(False)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         header = table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         return table
@@ -1132,41 +1266,11 @@ class ResultsView(QTabWidget):
         self,
         result: AnalizationResult
     ) -> None:
-        self._update_table(
-            self._errors_table,
-            result.errors,
-            lambda e: [
-                str(e.line),
-                str(e.column),
-                e.message
-            ]
-        )
-        self._update_table(
-            self._quadruples_table,
-            result.quadruples if not result.errors else [],
-            lambda q: [
-                q.operator,
-                q.arg1,
-                q.arg2,
-                q.result
-            ]
+        self._errors_model.set_items(result.errors)
+        self._quadruples_model.set_items(
+            result.quadruples if not result.errors else []
         )
 
-    def _update_table(
-        self,
-        table: QTableWidget,
-        items: Sequence[Any],
-        mapper: Callable[[Any], List[str]]
-    ) -> None:
-        table.setRowCount(len(items))
-        for row, item in enumerate(items):
-            for col, value in enumerate(mapper(item)):
-                table.setItem(
-                    row,
-                    col,
-                    QTableWidgetItem(value)
-                )
-
 
 class MainWindow(QMainWindow):
     _open_file_requested = Signal(str)
@@ -1186,6 +1290,8 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         self._editor = TextEditor()
+        self._code_cache: Optional[str] = None
+        self._code_revision = -1
         self._results_view = ResultsView()
 
         layout.addWidget(self._editor, 3)
@@ -1240,10 +1346,16 @@ class MainWindow(QMainWindow):
 
     @property
     def code(self) -> str:
-        return self._editor.toPlainText()
+        revision = self._editor.document().revision()
+        if self._code_cache is None or revision != self._code_revision:
+            self._code_cache = self._editor.toPlainText()
+            self._code_revision = revision
+        return self._code_cache
 
     @code.setter
     def code(self, value: str) -> None:
+        if value == self.code:
+            return
         self._editor.setPlainText(value)
 
 
@@ -1264,45 +1376,109 @@ class ApplicationController(QObject):
         self._window = window
         self._analizer = analizer
         self._file_service = file_service
+        self._analize_pool = QThreadPool(self)
+        self._analize_pool.setMaxThreadCount(1)
+        self._analize_signals = CommandSignals(self)
+        self._analize_ticket = 0
+        self._file_pool = QThreadPool(self)
+        self._file_pool.setMaxThreadCount(1)
+        self._open_signals = CommandSignals(self)
+        self._open_ticket = 0
+        self._save_signals = CommandSignals(self)
         self._connect_signals()
 
     def _connect_signals(self) -> None:
         self._window._open_file_requested.connect(self._handle_open)
         self._window._save_file_requested.connect(self._handle_save)
         self._window._analize_requested.connect(self._handle_analize)
+        self._analize_signals.finished.connect(self._handle_analize_finished)
+        self._analize_signals.failed.connect(self._handle_analize_failed)
+        self._open_signals.finished.connect(self._handle_open_finished)
+        self._open_signals.failed.connect(self._handle_open_failed)
+        self._save_signals.failed.connect(self._handle_save_failed)
 
     def _handle_open(
         self,
         path: str
     ) -> None:
-        try:
-            cmd = FileReadCommand(
+        self._open_ticket += 1
+        self._file_pool.start(CommandTask(
+            FileReadCommand(
                 path,
                 self._file_service
-            )
-            content = cmd.execute()
-            self._window.code = content
-        except FileServiceError as e:
-            self._window.show_error(str(e))
+            ),
+            self._open_ticket,
+            self._open_signals
+        ))
+
+    def _handle_open_finished(
+        self,
+        ticket: int,
+        content: str
+    ) -> None:
+        if ticket != self._open_ticket:
+            return
+        self._window.code = content
+
+    def _handle_open_failed(
+        self,
+        ticket: int,
+        message: str
+    ) -> None:
+        if ticket != self._open_ticket:
+            return
+        self._window.show_error(message)
 
     def _handle_save(
         self,
         path: str
     ) -> None:
-        try:
-            cmd = FileWriteCommand(
+        self._file_pool.start(CommandTask(
+            FileWriteCommand(
                 path,
                 self._window.code,
                 self._file_service
-            )
-            cmd.execute()
-        except FileServiceError as e:
-            self._window.show_error(str(e))
+            ),
+            0,
+            self._save_signals
+        ))
+
+    def _handle_save_failed(
+        self,
+        _ticket: int,
+        message: str
+    ) -> None:
+        self._window.show_error(message)
 
     def _handle_analize(self) -> None:
-        result = self._analizer.analize(self._window.code)
+        self._analize_ticket += 1
+        self._analize_pool.start(CommandTask(
+            AnalizeCommand(
+                self._window.code,
+                self._analizer
+            ),
+            self._analize_ticket,
+            self._analize_signals
+        ))
+
+    def _handle_analize_finished(
+        self,
+        ticket: int,
+        result: AnalizationResult
+    ) -> None:
+        if ticket != self._analize_ticket:
+            return
         self._window._results_view.display_results(result)
 
+    def _handle_analize_failed(
+        self,
+        ticket: int,
+        message: str
+    ) -> None:
+        if ticket != self._analize_ticket:
+            return
+        self._window.show_error(message)
+
 
 def bootstrap() -> Tuple[MainWindow, ApplicationController]:
     error_handler = ErrorHandler()